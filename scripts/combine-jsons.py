@@ -1,8 +1,45 @@
 import argparse
-import json
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, zip_longest
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_json_array(items: Iterable[dict], out_path: Path) -> None:
+    """Write `items` as a 2-space indented JSON array, one element at a time.
+
+    Produces the same bytes as dumping the whole list with ``indent=2``, but
+    only ever holds one encoded element in memory.
+    """
+    sep = b"\n"
+    with open(out_path, "wb") as f:
+        f.write(b"[")
+        for item in items:
+            f.write(sep)
+            # Nest the element one level deeper. Encoded JSON strings never
+            # contain raw newlines, so this only touches the layout.
+            f.write(b"  " + _dumps(item).replace(b"\n", b"\n  "))
+            sep = b",\n"
+        f.write(b"]\n" if sep == b"\n" else b"\n]\n")
+
 
 def combine_bowser(
     bowser_paths: Sequence[Path], names: Sequence[str], out_suffix: str = "_combined"
@@ -26,6 +63,9 @@ def combine_bowser(
     parent_dirs = []
     json_paths = []
     for p in bowser_paths:
+        if p.suffix == ".jsonl":
+            # This script reads and writes only the JSON-array format
+            raise ValueError(f"{p}: JSON Lines configs are not supported")
         if p.is_file():
             parent_dirs.append(p.parent)
             json_paths.append(p)
@@ -33,44 +73,39 @@ def combine_bowser(
             parent_dirs.append(p)
             json_paths.append(p / "bowser_rasters.json")
 
-    def adjust_paths(d, path):
+    def adjust_paths(d, path: str):
         """Adjust file paths in the data dictionary to be relative to the given path."""
-        file_list = []
-        for fn in d["file_list"]:
-            file_list.append(f"{path}/{fn}")
-        d["file_list"] = file_list
-
-        mask_file_list = []
-        for fn in d["mask_file_list"]:
-            mask_file_list.append(f"{path}/{fn}")
-        d["mask_file_list"] = mask_file_list
-
-    # Load and process data from each source
-    all_data = []
+        d["file_list"] = [f"{path}/{fn}" for fn in d["file_list"]]
+        d["mask_file_list"] = [f"{path}/{fn}" for fn in d["mask_file_list"]]
 
-    for parent, p, name_prefix in zip(parent_dirs, json_paths, names):
-        # Read the JSON file
-        d = json.loads(p.read_text())
+    def load_source(parent: Path, p: Path, name_prefix: str) -> list[dict]:
+        """Read one bowser_rasters.json, prefixing names and file paths."""
+        d = _loads(p.read_bytes())
 
         # Process each item in the data
+        parent_str = str(parent)
         for item in d:
             item["name"] = f"{name_prefix}: {item['name']}"
-            adjust_paths(item, parent)
+            adjust_paths(item, parent_str)
+        return d
 
-        all_data.append(d)
+    # Load and process data from each source. Sources often live on network
+    # storage, so read them concurrently; `map` keeps the input order.
+    with ThreadPoolExecutor(max_workers=min(8, len(json_paths))) as executor:
+        all_data = list(executor.map(load_source, parent_dirs, json_paths, names))
 
     # Combine all data by interleaving items from each source
     outname = f"bowser_rasters{out_suffix}.json"
-    out = []
 
     # Interleave items: first item from each source, then second item from each source
-    max_length = max(len(data_source) for data_source in all_data)
-    for i in range(max_length):
-        for data_source in all_data:
-            if i >= len(data_source):
-                continue
-            out.append(data_source[i])
-    Path(outname).write_text(json.dumps(out, indent=2) + "\n")
+    # Shorter sources are padded with a sentinel that gets filtered back out.
+    missing = object()
+    out = (
+        item
+        for item in chain.from_iterable(zip_longest(*all_data, fillvalue=missing))
+        if item is not missing
+    )
+    _write_json_array(out, Path(outname))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,11 @@
+import os
 from pathlib import Path
 
 from .titiler import Algorithm
+from .utils import glob_dir
+
+_SHIFT = Algorithm.SHIFT.value
+_REWRAP = Algorithm.REWRAP.value
 
 CORE_DATASETS = [
     "displacement",
@@ -22,148 +27,126 @@ CORRECTION_DATASETS = [
 ]
 
 
+# (name, subdir, extra fields) for each DISP-S1 group. Files are matched with
+# "*.vrt" unless a "pattern" is given; an optional "mask_subdir" is expanded
+# into that subdirectory's "mask_file_list".
+_DISP_S1_SPECS: list[tuple[str, str, dict]] = [
+    (
+        "Displacement",
+        "displacement",
+        {
+            "uses_spatial_ref": True,
+            "algorithm": _SHIFT,
+            "mask_subdir": "connected_component_labels",
+        },
+    ),
+    ("Short Wavelength Displacement", "short_wavelength_displacement", {}),
+    ("Connected Component Labels", "connected_component_labels", {}),
+    ("Re-wrapped phase", "displacement", {"algorithm": _REWRAP}),
+    ("Persistent Scatterer Mask", "persistent_scatterer_mask", {}),
+    ("Temporal Coherence", "temporal_coherence", {}),
+    ("Phase Similarity", "phase_similarity", {}),
+    ("Timeseries Inversion Residuals", "timeseries_inversion_residuals", {}),
+    ("Estimated Phase quality", "estimated_phase_quality", {}),
+    ("SHP counts", "shp_counts", {}),
+    ("Water Mask", "water_mask", {}),
+    ("Unwrapper Mask", "unwrapper_mask", {}),
+    (
+        "Ionospheric Delay",
+        "corrections/ionospheric_delay",
+        {"pattern": "*vrt", "uses_spatial_ref": True, "algorithm": _SHIFT},
+    ),
+    (
+        "Perpendicular Baseline",
+        "corrections/perpendicular_baseline",
+        {"pattern": "*vrt"},
+    ),
+    (
+        "Solid Earth Tide",
+        "corrections/solid_earth_tide",
+        {"pattern": "*vrt", "uses_spatial_ref": True, "algorithm": _SHIFT},
+    ),
+]
+
+
 def get_disp_s1_outputs(disp_s1_dir: Path | str):
+    root = Path(disp_s1_dir).resolve()
+    # Several groups share a subdirectory: list each one only once.
+    listings: dict[str, list[str]] = {}
+
     def _glob(pattern: str, subdir: str) -> list[str]:
-        return [str(p.resolve()) for p in sorted((Path(disp_s1_dir) / subdir).glob(pattern))]
+        # Resolve symlinked products to their targets
+        return [
+            os.path.realpath(f) for f in glob_dir(str(root / subdir), pattern, listings)
+        ]
 
-    return [
-        {
-            "name": "Displacement",
-            "file_list": _glob("*.vrt", subdir="displacement"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-            "mask_file_list": _glob("*.vrt", subdir="connected_component_labels"),
-        },
-        {
-            "name": "Short Wavelength Displacement",
-            "file_list": _glob("*.vrt", subdir="short_wavelength_displacement"),
-        },
-        {
-            "name": "Connected Component Labels",
-            "file_list": _glob("*.vrt", subdir="connected_component_labels"),
-        },
-        {
-            "name": "Re-wrapped phase",
-            "file_list": _glob("*.vrt", subdir="displacement"),
-            "algorithm": Algorithm.REWRAP.value,
-        },
-        {
-            "name": "Persistent Scatterer Mask",
-            "file_list": _glob("*.vrt", subdir="persistent_scatterer_mask"),
-        },
-        {
-            "name": "Temporal Coherence",
-            "file_list": _glob("*.vrt", subdir="temporal_coherence"),
-        },
-        {
-            "name": "Phase Similarity",
-            "file_list": _glob("*.vrt", subdir="phase_similarity"),
-        },
-        {
-            "name": "Timeseries Inversion Residuals",
-            "file_list": _glob("*.vrt", subdir="timeseries_inversion_residuals"),
-        },
-        {
-            "name": "Estimated Phase quality",
-            "file_list": _glob("*.vrt", subdir="estimated_phase_quality"),
-        },
-        {
-            "name": "SHP counts",
-            "file_list": _glob("*.vrt", subdir="shp_counts"),
-        },
-        {
-            "name": "Water Mask",
-            "file_list": _glob("*.vrt", subdir="water_mask"),
-        },
-        {
-            "name": "Unwrapper Mask",
-            "file_list": _glob("*.vrt", subdir="unwrapper_mask"),
-        },
-        {
-            "name": "Ionospheric Delay",
-            "file_list": _glob("*vrt", subdir="corrections/ionospheric_delay"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-        },
-        {
-            "name": "Perpendicular Baseline",
-            "file_list": _glob("*vrt", subdir="corrections/perpendicular_baseline"),
-        },
-        {
-            "name": "Solid Earth Tide",
-            "file_list": _glob("*vrt", subdir="corrections/solid_earth_tide"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-        },
-    ]
+    def _group(name: str, subdir: str, extra: dict) -> dict:
+        extra = dict(extra)
+        pattern = extra.pop("pattern", "*.vrt")
+        group = {"name": name, "file_list": _glob(pattern, subdir)}
+        if "mask_subdir" in extra:
+            group["mask_file_list"] = _glob(pattern, extra.pop("mask_subdir"))
+        group.update(extra)
+        return group
+
+    return [_group(*spec) for spec in _DISP_S1_SPECS]
 
 
 def get_aligned_disp_s1_outputs(aligned_dir: Path | str):
-    from glob import glob
+    aligned_dir = str(Path(aligned_dir))
+    # Every group lives in the same flat directory: list it once.
+    listings: dict[str, list[str]] = {}
+
+    def _glob(pattern: str) -> list[str]:
+        return glob_dir(aligned_dir, pattern, listings)
 
     return [
         {
             "name": "Displacement",
-            "file_list": sorted(glob(str(Path(aligned_dir) / "displacement*.tif"))),
+            "file_list": _glob("displacement*.tif"),
             "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-            "mask_file_list": sorted(
-                glob(str(Path(aligned_dir) / "recommended_mask*.tif"))
-            ),
+            "algorithm": _SHIFT,
+            "mask_file_list": _glob("recommended_mask*.tif"),
         },
         {
             "name": "Short Wavelength Displacement",
-            "file_list": sorted(
-                glob(str(Path(aligned_dir) / "short_wavelength_displacement*.tif"))
-            ),
+            "file_list": _glob("short_wavelength_displacement*.tif"),
         },
         {
             "name": "Connected Component Labels",
-            "file_list": sorted(
-                glob(str(Path(aligned_dir) / "connected_component_labels*.tif"))
-            ),
+            "file_list": _glob("connected_component_labels*.tif"),
         },
         {
             "name": "Re-wrapped phase",
-            "file_list": sorted(glob(str(Path(aligned_dir) / "displacement*.tif"))),
-            "algorithm": Algorithm.REWRAP.value,
+            "file_list": _glob("displacement*.tif"),
+            "algorithm": _REWRAP,
         },
         {
             "name": "Persistent Scatterer Mask",
-            "file_list": sorted(
-                glob(str(Path(aligned_dir) / "persistent_scatterer_mask*.tif"))
-            ),
+            "file_list": _glob("persistent_scatterer_mask*.tif"),
         },
         {
             "name": "Temporal Coherence",
-            "file_list": sorted(
-                glob((str(Path(aligned_dir) / "temporal_coherence*.tif")))
-            ),
+            "file_list": _glob("temporal_coherence*.tif"),
         },
         {
             "name": "Phase Similarity",
-            "file_list": sorted(
-                glob((str(Path(aligned_dir) / "phase_similarity*.tif")))
-            ),
+            "file_list": _glob("phase_similarity*.tif"),
         },
         {
             "name": "Timeseries Inversion Residuals",
-            "file_list": sorted(
-                glob(str(Path(aligned_dir) / "timeseries_inversion_residuals*.tif"))
-            ),
+            "file_list": _glob("timeseries_inversion_residuals*.tif"),
         },
         {
             "name": "Estimated Phase quality",
-            "file_list": sorted(
-                glob(str(Path(aligned_dir) / "estimated_phase_quality*.tif"))
-            ),
+            "file_list": _glob("estimated_phase_quality*.tif"),
         },
         {
             "name": "SHP counts",
-            "file_list": sorted(glob((str(Path(aligned_dir) / "shp_counts*.tif")))),
+            "file_list": _glob("shp_counts*.tif"),
         },
         {
             "name": "Water Mask",
-            "file_list": sorted(glob((str(Path(aligned_dir) / "water_mask.tif")))),
+            "file_list": _glob("water_mask.tif"),
         },
     ]
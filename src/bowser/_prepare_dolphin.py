@@ -0,0 +1,185 @@
+from pathlib import Path
+
+import rasterio
+
+from .titiler import Algorithm, _find_files
+
+_SHIFT = Algorithm.SHIFT.value
+_REWRAP = Algorithm.REWRAP.value
+_AMPLITUDE = Algorithm.AMPLITUDE.value
+_PHASE = Algorithm.PHASE.value
+
+# (name, pattern, extra fields) for each dolphin output group. Patterns are
+# relative to the dolphin work directory; a tuple of patterns means "use the
+# first one that finds any files". An optional "mask_pattern" is expanded into
+# the group's "mask_file_list".
+_DOLPHIN_SPECS: list[tuple[str, str | tuple[str, ...], dict]] = [
+    (
+        "Time series",
+        "timeseries/2*[0-9].tif",
+        {"uses_spatial_ref": True, "algorithm": _SHIFT},
+    ),
+    (
+        "Velocity",
+        "timeseries/velocity.tif",
+        {"uses_spatial_ref": True, "algorithm": _SHIFT},
+    ),
+    (
+        "Velocity Std. Err.",
+        "timeseries/velocity_stderr.tif",
+        {"uses_spatial_ref": True, "algorithm": _SHIFT},
+    ),
+    ("Velocity Confidence Interval Margin", "timeseries/velocity_ci_margin.tif", {}),
+    ("Filtered time series", "filtered_timeseries*/2*[0-9].tif", {}),
+    (
+        "Filtered time series (deramped)",
+        "filtered_timeseries*/2*[0-9]_deramped.tif",
+        {"uses_spatial_ref": True, "algorithm": _SHIFT},
+    ),
+    ("Filtered velocity", "filtered_timeseries*/velocity.tif", {}),
+    (
+        "unwrapped",
+        "unwrapped/2*[0-9].unw.tif",
+        {
+            "mask_pattern": "unwrapped/*.unw.conncomp.tif",
+            "uses_spatial_ref": True,
+            "algorithm": _SHIFT,
+        },
+    ),
+    ("Connected components", "unwrapped/*.unw.conncomp.tif", {}),
+    (
+        "Nonzero connected component counts",
+        "timeseries/nonzero_conncomp_count_*.tif",
+        {},
+    ),
+    ("Multi-looked coherence", "interferograms/multilooked_coh*.tif", {}),
+    ("Re-wrapped phase", "unwrapped/2*[0-9].unw.tif", {"algorithm": _REWRAP}),
+    ("(Pseudo) correlation", "interferograms/*.cor.tif", {}),
+    ("PS mask", "interferograms/ps_mask_looked*.tif", {}),
+    (
+        "Temporal coherence",
+        (
+            "interferograms/temporal_coherence_[0-9]*.tif",
+            "interferograms/temporal_coherence*.tif",
+        ),
+        {},
+    ),
+    (
+        "Average temporal coherence",
+        "interferograms/temporal_coherence_average*.tif",
+        {},
+    ),
+    (
+        "Phase cosine similarity",
+        ("interferograms/similarity_[0-9]*.tif", "interferograms/similarity*.tif"),
+        {},
+    ),
+    ("Phase cosine similarity (full)", "interferograms/similarity_full*.tif", {}),
+    ("Standard deviation of estimated CRLB", "interferograms/crlb_2*[0-9].tif", {}),
+    (
+        "Average closure-phase-coherence",
+        "interferograms/closure_phase_coh_average_*[0-9].tif",
+        {},
+    ),
+    ("Closure-Coherence", "interferograms/closure_phase_coh_*[0-9].tif", {}),
+    ("Closure phase", "interferograms/closure_phase_2[0-9].tif", {}),
+    (
+        "Cumulative closure phase",
+        "interferograms/cumulative_closure_phase_*[0-9].tif",
+        {},
+    ),
+    (
+        "Amplitude dispersion",
+        "interferograms/amp_dispersion_looked*.tif",
+        {"algorithm": _AMPLITUDE},
+    ),
+    (
+        "Amplitude mean",
+        ("interferograms/amp_mean_looked*.tif", "interferograms/amp_mean*.tif"),
+        {"algorithm": _AMPLITUDE},
+    ),
+    ("SHP counts", "interferograms/shp_counts*.tif", {}),
+    ("Time series residuals", "timeseries/residuals_2*[0-9].tif", {}),
+    ("Point height correction", "timeseries/point_height_correction.tif", {}),
+    (
+        "Point height correction std. err.",
+        "timeseries/point_height_correction_stderr.tif",
+        {},
+    ),
+    ("Thermal expansion coefficient", "timeseries/thermal_expansion.tif", {}),
+    (
+        "Thermal expansion coefficient std. err.",
+        "timeseries/thermal_expansion_stderr.tif",
+        {},
+    ),
+    (
+        "Time series residuals (total sum)",
+        "timeseries/unw_inversion_residuals.tif",
+        {},
+    ),
+]
+# Only included with `include_ifgs`
+_DOLPHIN_INTERFEROGRAM_SPEC = (
+    "Interferograms",
+    "interferograms/[0-9]*.int.tif",
+    {"algorithm": _PHASE},
+)
+# NOTE would be interesting to load amplitude timeseries
+_DOLPHIN_AMPLITUDE_SPEC = (
+    "Amplitude",
+    "amplitude_db/2*_amp_db.tif",
+    {"algorithm": _AMPLITUDE},
+)
+
+
+def get_dolphin_outputs(dolphin_work_dir: Path | str, include_ifgs: bool = True):
+    # Most patterns share a handful of directories: list each one only once.
+    listings: dict[str, list[str]] = {}
+
+    def _readable_files(g):
+        try:
+            files = _find_files(g.replace("'", "").replace('"', ""), listings)
+        except (RuntimeError, Exception):
+            return []
+        readable = []
+        for f in files:
+            if not Path(f).exists():
+                continue
+            try:
+                with rasterio.open(f):
+                    pass
+                readable.append(f)
+            except KeyError:
+                # rasterio doesn't recognise the GDAL dtype (e.g. Float16 = type 15)
+                # but the file is still valid — include it
+                readable.append(f)
+            except Exception:
+                pass
+        return readable
+
+    def _first_readable_files(*patterns):
+        """Return result of first pattern that finds any files."""
+        for p in patterns:
+            result = _readable_files(p)
+            if result:
+                return result
+        return []
+
+    wd = str(Path(dolphin_work_dir).resolve())
+
+    def _glob(patterns: str | tuple[str, ...]) -> list[str]:
+        if isinstance(patterns, str):
+            return _readable_files(f"{wd}/{patterns}")
+        return _first_readable_files(*(f"{wd}/{p}" for p in patterns))
+
+    def _group(name: str, patterns: str | tuple[str, ...], extra: dict) -> dict:
+        group = {"name": name, "file_list": _glob(patterns), **extra}
+        if "mask_pattern" in group:
+            group["mask_file_list"] = _glob(group.pop("mask_pattern"))
+        return group
+
+    specs = list(_DOLPHIN_SPECS)
+    if include_ifgs:
+        specs.append(_DOLPHIN_INTERFEROGRAM_SPEC)
+    specs.append(_DOLPHIN_AMPLITUDE_SPEC)
+    return [_group(*spec) for spec in specs]
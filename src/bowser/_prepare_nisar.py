@@ -1,6 +1,11 @@
 from pathlib import Path
 
 from .titiler import Algorithm
+from .utils import glob_dir
+
+_SHIFT = Algorithm.SHIFT.value
+_PHASE = Algorithm.PHASE.value
+_REWRAP = Algorithm.REWRAP.value
 
 # Define NISAR GUNW datasets to extract
 NISAR_BASE_PATH = "/science/LSAR/GUNW/grids"
@@ -23,15 +28,20 @@ NISAR_GUNW_DATASETS = [
 
 
 def get_nisar_outputs(nisar_dir: Path | str):
+    root = Path(nisar_dir)
+    # unwrappedPhase, coherenceMagnitude and connectedComponents each back
+    # more than one group; only list each subdirectory once.
+    listings: dict[str, list[str]] = {}
+
     def _glob(pattern: str, subdir: str) -> list[str]:
-        return [str(p) for p in sorted((Path(nisar_dir) / subdir).glob(pattern))]
+        return glob_dir(str(root / subdir), pattern, listings)
 
     return [
         {
             "name": "Unwrapped Phase",
             "file_list": _glob("*.vrt", subdir="unwrappedPhase"),
             "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
+            "algorithm": _SHIFT,
             "mask_file_list": _glob("*.vrt", subdir="connectedComponents"),
         },
         {
@@ -46,7 +56,7 @@ def get_nisar_outputs(nisar_dir: Path | str):
             "name": "Ionosphere Phase Screen",
             "file_list": _glob("*.vrt", subdir="ionospherePhaseScreen"),
             "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
+            "algorithm": _SHIFT,
         },
         {
             "name": "Ionosphere Phase Uncertainty",
@@ -55,7 +65,7 @@ def get_nisar_outputs(nisar_dir: Path | str):
         {
             "name": "Wrapped Interferogram",
             "file_list": _glob("*.vrt", subdir="wrappedInterferogram"),
-            "algorithm": Algorithm.PHASE.value,
+            "algorithm": _PHASE,
         },
         {
             "name": "Wrapped Coherence",
@@ -64,7 +74,7 @@ def get_nisar_outputs(nisar_dir: Path | str):
         {
             "name": "Re-wrapped Phase",
             "file_list": _glob("*.vrt", subdir="unwrappedPhase"),
-            "algorithm": Algorithm.REWRAP.value,
+            "algorithm": _REWRAP,
         },
         {
             "name": "Along-Track Offset",
@@ -1,4 +1,5 @@
 import logging
+import os
 from functools import partial
 from pathlib import Path
 from typing import Sequence
@@ -13,6 +14,48 @@ from tqdm.contrib.concurrent import process_map
 
 logger = logging.getLogger("bowser")
 
+# Each requested dataset is a separate gdal.Translate over the same /vsis3/
+# file. A larger curl cache lets later datasets reuse the HDF5 superblock and
+# chunk-index ranges fetched by earlier ones instead of re-downloading them.
+_REMOTE_GDAL_CONFIG = {
+    "CPL_VSIL_CURL_CACHE_SIZE": "200000000",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    # Range-request through multiplexed HTTP/2 connections, and skip the
+    # HEAD probe that would otherwise precede the first read of each file.
+    "GDAL_HTTP_VERSION": "2",
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+}
+
+
+def _is_s3_url(path: Path | str) -> bool:
+    # Only plain strings can be S3 URLs (Path collapses "s3://" to "s3:/"),
+    # so there is no need to str() every Path just to check its prefix.
+    return isinstance(path, str) and path.startswith("s3://")
+
+
+def _vrt_filename(netcdf_file: Path | str) -> str:
+    """Name the VRTs made from `netcdf_file` after its date pair, else its stem."""
+    # Extract date information from the filename
+    try:
+        fmt = "%Y%m%d"
+        # TODO: NISAR ifgs may have 4 dates in them
+        # Rethink how to make this filename here for multiple products
+        dates = get_dates(netcdf_file, fmt=fmt)[:2]
+        return f"{dates[0].strftime(fmt)}_{dates[1].strftime(fmt)}.vrt"
+    except IndexError:
+        # Date parsing failed: just use stem
+        # TODO: NISAR holds ref/secondary as
+        # /science/LSAR/identification/secondaryZeroDopplerEndTime
+        return f"{Path(netcdf_file).stem}.vrt"
+
+
+def _dataset_output_dir(
+    output_dir: Path, in_dataset: str, strip_group_path: bool
+) -> Path:
+    out_dataset = in_dataset if not strip_group_path else in_dataset.split("/")[-1]
+    return output_dir / out_dataset
+
 
 def process_netcdf_files(
     netcdf_files: Sequence[Path | str],
@@ -43,27 +86,52 @@ def process_netcdf_files(
     -------
     None
 
+    Raises
+    ------
+    ValueError
+        If two different inputs would write VRTs with the same filename.
+
     Notes
     -----
     This function processes all NetCDF files in the input directory, creates VRT files
     for each specified dataset, and builds overviews for the created VRT files.
 
     """
-    # Ensure output directory exists
+    # Every input writes one VRT per dataset, named by `_vrt_filename`. Refuse
+    # inputs that share a name (e.g. undated a/product.nc and b/product.nc)
+    # instead of letting one silently overwrite the other's VRTs.
+    sources: dict[str, Path | str] = {}
+    for f in netcdf_files:
+        vrt_filename = _vrt_filename(f)
+        other = sources.setdefault(vrt_filename, f)
+        if other != f:
+            msg = f"{other} and {f} would both be written to {vrt_filename}"
+            raise ValueError(msg)
+
+    # Ensure the output directory and every per-dataset subdirectory exist, so
+    # the workers don't repeat the mkdir for each (file, dataset) pair.
     out_path = Path(output_dir)
     out_path.mkdir(exist_ok=True, parents=True)
+    for in_dataset in datasets:
+        _dataset_output_dir(out_path, in_dataset, strip_group_path).mkdir(
+            exist_ok=True, parents=True
+        )
 
-    if any(str(f).startswith("s3://") for f in netcdf_files):
+    if any(_is_s3_url(f) for f in netcdf_files):
         aws_credentials = AWSCredentials.from_asf(endpoint=ASFCredentialEndpoints.OPERA)
     else:
         aws_credentials = None
 
+    # Split the cores between the worker processes for overview building.
+    overview_threads = max(1, (os.cpu_count() or 1) // max(1, max_workers))
+
     func = partial(
         process_single_file,
         output_dir=output_dir,
         datasets=datasets,
         aws_credentials=aws_credentials,
         strip_group_path=strip_group_path,
+        overview_threads=overview_threads,
     )
 
     process_map(
@@ -79,9 +147,13 @@ def process_single_file(
     datasets: list[str],
     aws_credentials: AWSCredentials | None,
     strip_group_path: bool = False,
+    overview_threads: int = 1,
 ) -> None:
     """Create VRT files from subdatasets and build overviews.
 
+    The per-dataset output directories must already exist; see
+    `process_netcdf_files`.
+
     Parameters
     ----------
     netcdf_file : str
@@ -97,58 +169,81 @@ def process_single_file(
         If True, the output directory for the VRTs is only one level deep.
         Otherwise, uses the full HDF5 path as VRT path.
         Default is False.
+    overview_threads : int
+        Number of threads GDAL may use to build each file's overviews.
+        Default is 1.
 
     Returns
     -------
     None
 
     """
-    # Extract date information from the filename
-
-    try:
-        fmt = "%Y%m%d"
-        # TODO: NISAR ifgs may have 4 dates in them
-        # Rethink how to make this filename here for multiple products
-        dates = get_dates(netcdf_file, fmt=fmt)[:2]
-        vrt_filename = f"{dates[0].strftime(fmt)}_{dates[1].strftime(fmt)}.vrt"
-    except IndexError:
-        # Date parsing failed: just use stem
-        # TODO: NISAR holds ref/secondary as
-        # /science/LSAR/identification/secondaryZeroDopplerEndTime
-        vrt_filename = f"{str(netcdf_file).replace('/', '_')}.vrt"
-
-    if str(netcdf_file).startswith("s3://"):
+    vrt_filename = _vrt_filename(netcdf_file)
+
+    # The GDAL source path is the same for every dataset, so resolve it once.
+    # Use an absolute path so the VRT is portable across working dirs.
+    # S3 paths must not go through Path.resolve() — that would mangle the
+    # double-slash in s3://.  Map them directly to /vsis3/ for GDAL.
+    if _is_s3_url(netcdf_file):
+        gdal_netcdf = netcdf_file.replace("s3://", "/vsis3/", 1)
         hf = open_h5(netcdf_file, aws_credentials=aws_credentials)
         logger.debug(f"Read remote {netcdf_file}")
     else:
+        gdal_netcdf = str(Path(netcdf_file).resolve())
         hf = h5py.File(netcdf_file)
 
-    for in_dataset in datasets:
-        if in_dataset not in hf:
-            continue
-        out_dataset = in_dataset if not strip_group_path else in_dataset.split("/")[-1]
-        cur_output_dir = output_dir / out_dataset
-        cur_output_dir.mkdir(exist_ok=True, parents=True)
-
-        vrt_path = cur_output_dir / vrt_filename
-
-        # Create VRT file (use absolute path so VRT is portable across working dirs).
-        # S3 paths must not go through Path.resolve() — that would mangle the
-        # double-slash in s3://.  Map them directly to /vsis3/ for GDAL.
-        nc_str = str(netcdf_file)
-        if nc_str.startswith("s3://"):
-            gdal_netcdf = nc_str.replace("s3://", "/vsis3/", 1)
-        else:
-            gdal_netcdf = str(Path(netcdf_file).resolve())
-        gdal.Translate(
-            str(vrt_path),
-            f"netcdf:{gdal_netcdf}:{in_dataset}",
-            outputType=gdal.GDT_Float32,  # Float64 breaks PNG tile rendering in titiler
-            callback=gdal.TermProgress_nocb,
-        )
-
-        # Build overviews
-        ds = gdal.Open(str(vrt_path))
-        if ds is not None:
-            ds.BuildOverviews("NEAREST", [2, 4, 8, 16, 32])
-            ds = None
+    # h5py is only needed to see which datasets exist. Close it before GDAL
+    # reopens the file for each Translate, so each worker holds a single
+    # HDF5 handle at a time and none leak across files.
+    with hf:
+        present = _find_datasets(hf, datasets)
+
+    # Thread-local and restored afterwards, so each concurrent worker keeps its
+    # own share of cores and the remote-read tuning doesn't leak past this file.
+    config = {"GDAL_NUM_THREADS": str(overview_threads)}
+    if _is_s3_url(netcdf_file):
+        config.update(_REMOTE_GDAL_CONFIG)
+    previous = {key: gdal.GetThreadLocalConfigOption(key) for key in config}
+    for key, value in config.items():
+        gdal.SetThreadLocalConfigOption(key, value)
+    try:
+        for in_dataset in present:
+            cur_output_dir = _dataset_output_dir(
+                output_dir, in_dataset, strip_group_path
+            )
+            vrt_path = cur_output_dir / vrt_filename
+
+            # Create VRT file
+            ds = gdal.Translate(
+                str(vrt_path),
+                f"netcdf:{gdal_netcdf}:{in_dataset}",
+                outputType=gdal.GDT_Float32,  # Float64 breaks PNG tiles in titiler
+                callback=gdal.TermProgress_nocb,
+            )
+
+            # Build overviews on the dataset Translate returned, rather than
+            # reopening the VRT (and its netCDF source) from disk
+            if ds is not None:
+                ds.BuildOverviews("NEAREST", [2, 4, 8, 16, 32])
+                ds = None
+    finally:
+        for key, value in previous.items():
+            gdal.SetThreadLocalConfigOption(key, value)
+
+
+def _find_datasets(hf: h5py.File, datasets: Sequence[str]) -> list[str]:
+    """Return the entries of `datasets` that exist in `hf`, in the same order.
+
+    Requested datasets mostly share a few parent groups, so list each parent
+    group's members once instead of resolving every full path separately.
+    """
+    members: dict[str, set[str]] = {}
+    present = []
+    for name in datasets:
+        parent, _, child = name.rstrip("/").rpartition("/")
+        if parent not in members:
+            group = hf.get(parent or "/")
+            members[parent] = set(group) if isinstance(group, h5py.Group) else set()
+        if child in members[parent]:
+            present.append(name)
+    return present
@@ -13,19 +13,30 @@ import uvicorn
 logger = logging.getLogger(__name__)
 
 
-def _find_available_port(start_port: int = 8000) -> int:
-    """Find an available port starting from start_port."""
-    port = start_port - 1
-    while True:
-        port += 1
+def _find_available_port(port_request: int = 8000) -> int:
+    """Return `port_request` if it is free, otherwise any free port."""
+    # Keep the requested port when it's free so URLs stay stable between runs;
+    # otherwise let the kernel pick a free ephemeral port in a single bind().
+    # No SO_REUSEADDR: without it the bind also fails next to a listener on
+    # 0.0.0.0, and uvicorn sets the option on its own socket anyway.
+    for port in (port_request, 0):
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            result = s.connect_ex(("127.0.0.1", port))
-            if result != 0:
-                return port
+            try:
+                s.bind(("127.0.0.1", port))
+            except OSError:
+                continue
+            return s.getsockname()[1]
+    msg = "No free port available"
+    raise RuntimeError(msg)
 
 
-def _setup_gdal_env(ignore_sidecar_files: bool = False):
+def _setup_gdal_env(
+    ignore_sidecar_files: bool = False,
+    gdal_cachemax_mb: int | None = None,
+    vsi_cache_mb: int | None = None,
+):
     """Set up GDAL environment variables for optimal performance."""
+    # https://developmentseed.org/titiler/advanced/performance_tuning/
     cfg = {
         "GDAL_HTTP_MULTIPLEX": "YES",
         "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
@@ -34,10 +45,24 @@ def _setup_gdal_env(ignore_sidecar_files: bool = False):
         "VSI_CACHE": "TRUE",
         "VSI_CACHE_SIZE": "5000000",
     }
+    # Settings already in the environment win over these defaults...
     for k, v in cfg.items():
-        os.environ[k] = v
+        os.environ.setdefault(k, v)
+    # ...and explicit CLI values win over both.
+    if gdal_cachemax_mb is not None:
+        os.environ["GDAL_CACHEMAX"] = str(gdal_cachemax_mb)
+    if vsi_cache_mb is not None:
+        os.environ["VSI_CACHE_SIZE"] = str(vsi_cache_mb * 1_000_000)
     if ignore_sidecar_files:
         os.environ["GDAL_DISABLE_READDIR_ON_OPEN"] = "EMPTY_DIR"
+        # Cloud reads: only issue HTTP requests for the formats bowser reads
+        # (skips probing for .aux.xml, .msk, ...), and fetch enough of each
+        # file on open to get a COG's header in a single GET.
+        # https://gdal.org/en/stable/user/configoptions.html
+        os.environ.setdefault(
+            "CPL_VSIL_CURL_ALLOWED_EXTENSIONS", ".tif,.tiff,.vrt,.ovr,.nc,.h5"
+        )
+        os.environ.setdefault("GDAL_INGESTED_BYTES_AT_OPEN", "32768")
 
 
 class BowserServer:
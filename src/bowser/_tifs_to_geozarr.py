@@ -51,6 +51,7 @@ import xarray as xr
 from opera_utils import get_dates
 
 from .geozarr import ZarrWriteConfig, annotate_store, shard_encoding
+from .utils import load_raster_config
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +81,7 @@ def convert(
 ) -> list[str]:
     """Run the conversion. Returns the list of variable names written."""
     logging.basicConfig(level=logging.INFO if verbose else logging.WARNING)
-    groups_cfg = [g for g in json.loads(Path(config).read_text()) if g.get("file_list")]
+    groups_cfg = [g for g in load_raster_config(config) if g.get("file_list")]
     assert groups_cfg, f"No non-empty raster groups in {config}"
 
     # Spatial reference comes from the first file of the first group — all groups
@@ -1,16 +1,29 @@
-import json
+import logging
 import os
 from pathlib import Path
 from typing import Any
 
 import click
 
+logger = logging.getLogger("bowser")
+
 
 @click.group()
 def cli_app():
     """CLI for bowser."""
 
 
+def _parse_workers(_ctx, _param, value: str) -> int:
+    if value == "auto":
+        # Tile requests are independent, so spread them over the cores.
+        return min(8, 2 * (os.cpu_count() or 1) + 1)
+    try:
+        return int(value)
+    except ValueError:
+        msg = f"{value!r} is not an integer or 'auto'."
+        raise click.BadParameter(msg) from None
+
+
 @cli_app.command()
 @click.option(
     "-s",
@@ -48,9 +61,13 @@ def cli_app():
 @click.option(
     "--workers",
     "-w",
-    default=1,
-    type=int,
-    help="Number of uvicorn workers to spawn",
+    default="1",
+    callback=_parse_workers,
+    help=(
+        "Number of uvicorn workers to spawn, or 'auto' for 2 * CPU cores + 1"
+        " (capped at 8). Each worker is a separate process that loads every"
+        " dataset and has its own GDAL block cache (GDAL_CACHEMAX)."
+    ),
     show_default=True,
 )
 @click.option(
@@ -69,6 +86,24 @@ def cli_app():
         " for local reading)."
     ),
 )
+@click.option(
+    "--gdal-cachemax-mb",
+    default=None,
+    type=int,
+    help=(
+        "GDAL raster block cache size (MB) per worker. Default: $GDAL_CACHEMAX"
+        " if set, else 800."
+    ),
+)
+@click.option(
+    "--vsi-cache-mb",
+    default=None,
+    type=int,
+    help=(
+        "GDAL VSI file cache size (MB) per open file. Default: $VSI_CACHE_SIZE"
+        " if set, else 5."
+    ),
+)
 @click.option(
     "--no-spatial-reference",
     "--ns",
@@ -110,6 +145,8 @@ def run(
     workers,
     log_level,
     ignore_sidecar_files,
+    gdal_cachemax_mb,
+    vsi_cache_mb,
     no_spatial_reference,
     no_recommended_mask,
     title,
@@ -120,9 +157,15 @@ def run(
     """Run the web server."""
     import uvicorn
 
+    from ._server import _find_available_port, _setup_gdal_env
+
     if port is None:
         port = _find_available_port(8000)
-    _setup_gdal_env(ignore_sidecar_files)
+    _setup_gdal_env(
+        ignore_sidecar_files,
+        gdal_cachemax_mb=gdal_cachemax_mb,
+        vsi_cache_mb=vsi_cache_mb,
+    )
     if stack_file:
         os.environ["BOWSER_STACK_DATA_FILE"] = stack_file
     else:
@@ -141,6 +184,8 @@ def run(
     protocol = "https" if ssl_certfile else "http"
     display_host = "localhost" if host in ("127.0.0.1", "0.0.0.0") else host
     print(f"Setting up on {protocol}://{display_host}:{port}")
+    # loop/http stay at uvicorn's "auto": uvloop and httptools are used when
+    # installed (`bowser-insar[speedups]`), with asyncio/h11 as the fallback.
     uvicorn.run(
         "bowser.main:app",
         host=host,
@@ -153,22 +198,6 @@ def run(
     )
 
 
-def _setup_gdal_env(ignore_sidecar_files: bool = False):
-    # https://developmentseed.org/titiler/advanced/performance_tuning/
-    cfg = {
-        "GDAL_HTTP_MULTIPLEX": "YES",
-        "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
-        "GDAL_CACHEMAX": "800",
-        "CPL_VSIL_CURL_CACHE_SIZE": "800",
-        "VSI_CACHE": "TRUE",
-        "VSI_CACHE_SIZE": "5000000",
-    }
-    for k, v in cfg.items():
-        os.environ[k] = v
-    if ignore_sidecar_files:
-        os.environ["GDAL_DISABLE_READDIR_ON_OPEN"] = "EMPTY_DIR"
-
-
 @cli_app.command()
 # @click.argument("name")
 # @click.argument("files", nargs=-1)
@@ -224,8 +253,12 @@ def set_data(output: Path, file_date_fmt: str):
         if click.confirm(
             "Do you have *matching* .conncomp.tif files you want to mask on?"
         ):
+            # Swap only the suffix, not "unw.tif" elsewhere in the path
             mask_file_list = [
-                f.replace("unw.tif", "unw.conncomp.tif") for f in file_list
+                f.removesuffix("unw.tif") + "unw.conncomp.tif"
+                if f.endswith("unw.tif")
+                else f
+                for f in file_list
             ]
         if not mask_file_list and click.confirm(
             "Do you want to search for mask files?"
@@ -271,10 +304,45 @@ def set_data(output: Path, file_date_fmt: str):
     _dump_raster_groups(raster_groups, output=output)
 
 
+def _build_raster_groups(groups: list[dict], **overrides) -> list:
+    """Build a `RasterGroup` from each group, skipping empty or invalid ones.
+
+    Groups without files (common for partially-run workflows) are dropped up
+    front. Every other group is built exactly once, since building one opens
+    all of its rasters; groups that fail are logged and skipped.
+    """
+    from .titiler import RasterGroup
+
+    raster_groups = []
+    for group in groups:
+        if not group.get("file_list"):
+            continue
+        try:
+            rg = RasterGroup(**group, **overrides)
+        except Exception as e:
+            logger.warning("Skipping %s: %s", group["name"], e)
+            continue
+        raster_groups.append(rg)
+    return raster_groups
+
+
 def _dump_raster_groups(raster_groups, output):
-    out_dicts = [rg.model_dump() for rg in raster_groups]
-    with open(output, "w") as f:
-        json.dump(out_dicts, f, indent=2)
+    from pydantic import TypeAdapter
+
+    from .titiler import RasterGroup
+
+    if Path(output).suffix == ".jsonl":
+        # JSON Lines: encode and write one group at a time, so only a single
+        # group's JSON is ever held in memory.
+        with open(output, "w") as f:
+            for rg in raster_groups:
+                f.write(rg.model_dump_json() + "\n")
+        return
+
+    # Serialize the whole list in one pass through pydantic-core, without
+    # building an intermediate dict per group.
+    adapter = TypeAdapter(list[RasterGroup])
+    Path(output).write_bytes(adapter.dump_json(raster_groups, indent=2))
 
 
 @cli_app.command()
@@ -296,249 +364,20 @@ def setup_dolphin(dolphin_work_dir, timeseries_mask, output, include_ifgs: bool
 
     Saves to `output` JSON file.
     """
-    from .titiler import Algorithm, RasterGroup, _find_files
+    from ._prepare_dolphin import get_dolphin_outputs
 
-    def _glob(g):
-        import rasterio
+    dolphin_outputs = get_dolphin_outputs(dolphin_work_dir, include_ifgs=include_ifgs)
 
-        try:
-            files = _find_files(g.replace("'", "").replace('"', ""))
-        except (RuntimeError, Exception):
-            return []
-        readable = []
-        for f in files:
-            if not Path(f).exists():
-                continue
-            try:
-                with rasterio.open(f):
-                    pass
-                readable.append(f)
-            except KeyError:
-                # rasterio doesn't recognise the GDAL dtype (e.g. Float16 = type 15)
-                # but the file is still valid — include it
-                readable.append(f)
-            except Exception:
-                pass
-        return readable
-
-    def _glob_first(*patterns):
-        """Return result of first pattern that finds any files."""
-        for p in patterns:
-            result = _glob(p)
-            if result:
-                return result
-        return []
-
-    wd = str(Path(dolphin_work_dir).resolve())
-
-    dolphin_outputs = [
-        {
-            "name": "Time series",
-            "file_list": _glob(f"{wd}/timeseries/2*[0-9].tif"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-        },
-        {
-            "name": "Velocity",
-            "file_list": _glob(f"{wd}/timeseries/velocity.tif"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-        },
-        {
-            "name": "Velocity Std. Err.",
-            "file_list": _glob(f"{wd}/timeseries/velocity_stderr.tif"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-        },
-        {
-            "name": "Velocity Confidence Interval Margin",
-            "file_list": _glob(f"{wd}/timeseries/velocity_ci_margin.tif"),
-        },
-        {
-            "name": "Filtered time series",
-            "file_list": _glob(f"{wd}/filtered_timeseries*/2*[0-9].tif"),
-        },
-        {
-            "name": "Filtered time series (deramped)",
-            "file_list": _glob(f"{wd}/filtered_timeseries*/2*[0-9]_deramped.tif"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-        },
-        {
-            "name": "Filtered velocity",
-            "file_list": _glob(f"{wd}/filtered_timeseries*/velocity.tif"),
-        },
-        {
-            "name": "unwrapped",
-            "file_list": _glob(f"{wd}/unwrapped/2*[0-9].unw.tif"),
-            "mask_file_list": _glob(f"{wd}/unwrapped/*.unw.conncomp.tif"),
-            "uses_spatial_ref": True,
-            "algorithm": Algorithm.SHIFT.value,
-        },
-        {
-            "name": "Connected components",
-            "file_list": _glob(f"{wd}/unwrapped/*.unw.conncomp.tif"),
-        },
-        {
-            "name": "Nonzero connected component counts",
-            "file_list": _glob(f"{wd}/timeseries/nonzero_conncomp_count_*.tif"),
-        },
-        {
-            "name": "Multi-looked coherence",
-            "file_list": _glob(f"{wd}/interferograms/multilooked_coh*.tif"),
-        },
-        {
-            "name": "Re-wrapped phase",
-            "file_list": _glob(f"{wd}/unwrapped/2*[0-9].unw.tif"),
-            "algorithm": Algorithm.REWRAP.value,
-        },
-        {
-            "name": "(Pseudo) correlation",
-            "file_list": _glob(f"{wd}/interferograms/*.cor.tif"),
-        },
-        {
-            "name": "PS mask",
-            "file_list": _glob(f"{wd}/interferograms/ps_mask_looked*.tif"),
-        },
-        {
-            "name": "Temporal coherence",
-            "file_list": _glob_first(
-                f"{wd}/interferograms/temporal_coherence_[0-9]*.tif",
-                f"{wd}/interferograms/temporal_coherence*.tif",
-            ),
-        },
-        {
-            "name": "Average temporal coherence",
-            "file_list": _glob(f"{wd}/interferograms/temporal_coherence_average*.tif"),
-        },
-        {
-            "name": "Phase cosine similarity",
-            "file_list": _glob_first(
-                f"{wd}/interferograms/similarity_[0-9]*.tif",
-                f"{wd}/interferograms/similarity*.tif",
-            ),
-        },
-        {
-            "name": "Phase cosine similarity (full)",
-            "file_list": _glob(f"{wd}/interferograms/similarity_full*.tif"),
-        },
-        {
-            "name": "Standard deviation of estimated CRLB",
-            "file_list": _glob(f"{wd}/interferograms/crlb_2*[0-9].tif"),
-        },
-        {
-            "name": "Average closure-phase-coherence",
-            "file_list": _glob(
-                f"{wd}/interferograms/closure_phase_coh_average_*[0-9].tif"
-            ),
-        },
-        {
-            "name": "Closure-Coherence",
-            "file_list": _glob(f"{wd}/interferograms/closure_phase_coh_*[0-9].tif"),
-        },
-        {
-            "name": "Closure phase",
-            "file_list": _glob(f"{wd}/interferograms/closure_phase_2[0-9].tif"),
-        },
-        {
-            "name": "Cumulative closure phase",
-            "file_list": _glob(
-                f"{wd}/interferograms/cumulative_closure_phase_*[0-9].tif"
-            ),
-        },
-        {
-            "name": "Amplitude dispersion",
-            "file_list": _glob(f"{wd}/interferograms/amp_dispersion_looked*.tif"),
-            "algorithm": Algorithm.AMPLITUDE.value,
-        },
-        {
-            "name": "Amplitude mean",
-            "file_list": _glob_first(
-                f"{wd}/interferograms/amp_mean_looked*.tif",
-                f"{wd}/interferograms/amp_mean*.tif",
-            ),
-            "algorithm": Algorithm.AMPLITUDE.value,
-        },
-        {
-            "name": "SHP counts",
-            "file_list": _glob(f"{wd}/interferograms/shp_counts*.tif"),
-        },
-        {
-            "name": "Time series residuals",
-            "file_list": _glob(f"{wd}/timeseries/residuals_2*[0-9].tif"),
-        },
-        {
-            "name": "Point height correction",
-            "file_list": _glob(f"{wd}/timeseries/point_height_correction.tif"),
-        },
-        {
-            "name": "Point height correction std. err.",
-            "file_list": _glob(f"{wd}/timeseries/point_height_correction_stderr.tif"),
-        },
-        {
-            "name": "Thermal expansion coefficient",
-            "file_list": _glob(f"{wd}/timeseries/thermal_expansion.tif"),
-        },
-        {
-            "name": "Thermal expansion coefficient std. err.",
-            "file_list": _glob(f"{wd}/timeseries/thermal_expansion_stderr.tif"),
-        },
-        {
-            "name": "Time series residuals (total sum)",
-            "file_list": _glob(f"{wd}/timeseries/unw_inversion_residuals.tif"),
-        },
-    ]
-    if include_ifgs:
-        dolphin_outputs.append(
-            {
-                "name": "Interferograms",
-                "file_list": _glob(f"{wd}/interferograms/[0-9]*.int.tif"),
-                "algorithm": Algorithm.PHASE.value,
-            }
-        )
-    # NOTE would be interesting to load amplitude timeseries
-    amplitude_files = _glob(f"{wd}/amplitude_db/2*_amp_db.tif")
-    if amplitude_files:
-        dolphin_outputs.append(
-            {
-                "name": "Amplitude",
-                "file_list": amplitude_files,
-                "algorithm": Algorithm.AMPLITUDE.value,
-            }
-        )
     if timeseries_mask is not None:
         # Timeseries
         dolphin_outputs[0]["mask_file_list"] = timeseries_mask
         # velocity
         dolphin_outputs[1]["mask_file_list"] = timeseries_mask
-    raster_groups = []
-    for group in dolphin_outputs:
-        if not group.get("file_list"):
-            continue
-        try:
-            rg = RasterGroup(**group)
-        except Exception as e:
-            print(f"Error processing {group['name']}: {e}")
-            continue
-        raster_groups.append(rg)
+    raster_groups = _build_raster_groups(dolphin_outputs)
 
     _dump_raster_groups(raster_groups, output=output)
 
 
-def _find_available_port(port_request: int = 8000):
-    import socket
-
-    port = port_request - 1
-    while (result := 0) == 0:
-        port += 1
-        # Check if the port is open
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            result = s.connect_ex(("127.0.0.1", port))
-
-        if result != 0:
-            return port
-
-
 @cli_app.command()
 @click.argument(
     "input_files",
@@ -556,7 +395,13 @@ def _find_available_port(port_request: int = 8000):
     default=False,
     help="Include corrections in addition to core datasets.",
 )
-def prepare_disp_s1(input_files, output_dir, corrections: bool):
+@click.option(
+    "--workers",
+    default=5,
+    show_default=True,
+    help="Number of files to process in parallel.",
+)
+def prepare_disp_s1(input_files, output_dir, corrections: bool, workers: int):
     """Process NetCDF files to create VRT files with overviews.
 
     INPUT_FILES: Paths to input NetCDF files or directories containing .nc files.
@@ -577,7 +422,9 @@ def prepare_disp_s1(input_files, output_dir, corrections: bool):
     )
 
     click.echo(f"Processing {len(input_files)} files into VRTS in {output_dir}")
-    process_netcdf_files(input_paths, Path(output_dir), datasets_to_process)
+    process_netcdf_files(
+        input_paths, Path(output_dir), datasets_to_process, max_workers=workers
+    )
 
 
 # TODO: consolidate this with disp-s1
@@ -593,7 +440,13 @@ def prepare_disp_s1(input_files, output_dir, corrections: bool):
     required=True,
     help="Path to the output directory where VRT files will be saved.",
 )
-def prepare_nisar_gunw(input_files, output_dir):
+@click.option(
+    "--workers",
+    default=5,
+    show_default=True,
+    help="Number of files to process in parallel.",
+)
+def prepare_nisar_gunw(input_files, output_dir, workers: int):
     """Process NetCDF files to create VRT files with overviews.
 
     INPUT_FILES: Paths to input NetCDF files.
@@ -605,7 +458,11 @@ def prepare_nisar_gunw(input_files, output_dir):
 
     click.echo(f"Processing {len(input_files)} files into VRTS in {output_dir}")
     process_netcdf_files(
-        input_paths, Path(output_dir), NISAR_GUNW_DATASETS, strip_group_path=True
+        input_paths,
+        Path(output_dir),
+        NISAR_GUNW_DATASETS,
+        max_workers=workers,
+        strip_group_path=True,
     )
 
 
@@ -626,18 +483,10 @@ def setup_disp_s1(disp_s1_dir: str, output: str):
     Saves to `output` JSON file.
     """
     from ._prepare_disp_s1 import get_disp_s1_outputs
-    from .titiler import RasterGroup
 
     disp_s1_outputs = get_disp_s1_outputs(disp_s1_dir)
 
-    raster_groups = []
-    for group in disp_s1_outputs:
-        try:
-            rg = RasterGroup(**group)
-        except Exception as e:
-            print(f"Error processing {group['name']}: {e}")
-            continue
-        raster_groups.append(rg)
+    raster_groups = _build_raster_groups(disp_s1_outputs)
 
     _dump_raster_groups(raster_groups, output=output)
 
@@ -659,18 +508,10 @@ def setup_aligned_disp_s1(disp_s1_dir: str, output: str):
     Saves to `output` JSON file.
     """
     from ._prepare_disp_s1 import get_aligned_disp_s1_outputs
-    from .titiler import RasterGroup
 
     disp_s1_outputs = get_aligned_disp_s1_outputs(disp_s1_dir)
 
-    raster_groups = []
-    for group in disp_s1_outputs:
-        try:
-            rg = RasterGroup(**group)
-        except Exception as e:
-            print(f"Error processing {group['name']}: {e}")
-            continue
-        raster_groups.append(rg)
+    raster_groups = _build_raster_groups(disp_s1_outputs)
 
     _dump_raster_groups(raster_groups, output=output)
 
@@ -794,10 +635,15 @@ def _make_cog(src_path: Path, dst_path: Path) -> None:
     from rasterio.enums import Resampling
     from rasterio.shutil import copy as rio_copy
 
-    overview_levels = [2, 4, 8, 16, 32]
+    # Averaging costs O(factor^2) reads per output pixel; at the coarsest level
+    # the image is a thumbnail, so nearest is visually equivalent and far cheaper.
+    overview_resampling = {
+        Resampling.average: [2, 4, 8, 16],
+        Resampling.nearest: [32],
+    }
     with rasterio.open(src_path, "r+") as ds:
-        ds.build_overviews(overview_levels, Resampling.average)
-        ds.update_tags(ns="rio_overview", resampling="average")
+        for resampling, levels in overview_resampling.items():
+            ds.build_overviews(levels, resampling)
 
     copy_profile = {
         "driver": "GTiff",
@@ -831,26 +677,23 @@ def setup_hyp3(hyp3_dir: str, output: str):
     HYP3_DIR should contain one or more directories with HyP3 Gamma InSAR products,
     where each directory contains files like *_unw_phase.tif, *_corr.tif, etc.
     """
-    from pathlib import Path
-
     from .titiler import Algorithm, RasterGroup
+    from .utils import glob_dir
+
+    # Get all product directories (they should all be directories)
+    with os.scandir(Path(hyp3_dir)) as it:
+        product_dirs = [e.path for e in it if e.is_dir()]
+    if not product_dirs:
+        raise click.UsageError(
+            f"No product directories found in {hyp3_dir}. "
+            "Expected directories containing HyP3 Gamma products."
+        )
+    # List each product directory once; every pattern below filters these names
+    listings: dict[str, list[str]] = {}
 
     def _glob_all_products(pattern: str) -> list[str]:
         """Find all files matching pattern across all product directories."""
-        p = Path(hyp3_dir)
-        # Get all product directories (they should all be directories)
-        product_dirs = [d for d in p.iterdir() if d.is_dir()]
-        if not product_dirs:
-            raise click.UsageError(
-                f"No product directories found in {hyp3_dir}. "
-                "Expected directories containing HyP3 Gamma products."
-            )
-        # For each product directory, find files matching pattern
-        matching_files: list[str] = []
-        for product_dir in product_dirs:
-            matches = list(product_dir.glob(pattern))
-            matching_files.extend(str(f) for f in matches)
-        return sorted(matching_files)
+        return sorted(f for d in product_dirs for f in glob_dir(d, pattern, listings))
 
     hyp3_outputs: list[dict[str, Any]] = [
         {
@@ -896,10 +739,10 @@ def setup_hyp3(hyp3_dir: str, output: str):
         try:
             rg = RasterGroup(**group)
         except Exception as e:
-            print(f"Error processing {group['name']}: {e}")
+            logger.warning("Skipping %s: %s", group["name"], e)
             continue
         if not rg.file_list:
-            print(f"No files found for {group['name']}, skipping.")
+            logger.warning("No files found for %s, skipping.", group["name"])
             continue
         raster_groups.append(rg)
 
@@ -929,18 +772,10 @@ def setup_nisar_gunw(nisar_dir: str, output: str):
     Saves to `output` JSON file.
     """
     from ._prepare_nisar import get_nisar_outputs
-    from .titiler import RasterGroup
 
     groups = get_nisar_outputs(nisar_dir)
 
-    raster_groups = []
-    for group in groups:
-        try:
-            rg = RasterGroup(**group, file_date_fmt=None)
-        except Exception as e:
-            print(f"Error processing {group['name']}: {e}")
-            continue
-        raster_groups.append(rg)
+    raster_groups = _build_raster_groups(groups, file_date_fmt=None)
 
     _dump_raster_groups(raster_groups, output=output)
 
@@ -27,7 +27,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response as StarletteResponse
 from starlette.staticfiles import StaticFiles
-from starlette.templating import Jinja2Templates
 from starlette_cramjam.middleware import CompressionMiddleware
 
 from .config import settings
@@ -79,8 +78,6 @@ h.setFormatter(
 )
 logger.addHandler(h)
 
-template_dir = Path(__file__).parent / "templates"
-templates = Jinja2Templates(directory=template_dir)
 desensitize_mpl_case()
 
 app = FastAPI(
@@ -623,6 +620,15 @@ async def point(
     return JSONResponse(values.tolist())
 
 
+def _to_chart_data(x_values: list, values: np.ndarray) -> list[dict[str, Any]]:
+    """Pair `x_values` with `values` as Chart.js points, dropping NaN values."""
+    # Find the NaNs in one vectorized pass and convert to Python floats once,
+    # rather than calling np.isnan on every element
+    values = np.atleast_1d(values).astype(float, copy=False)
+    keep = (~np.isnan(values)).tolist()
+    return [{"x": x, "y": y} for x, y, ok in zip(x_values, values.tolist(), keep) if ok]
+
+
 @app.get(
     "/chart_point",
     response_class=JSONResponse,
@@ -657,14 +663,6 @@ async def chart_point(
         rg = state.raster_groups[dataset_name]
         x_values = rg.x_values
 
-    def values_to_chart_data(values):
-        """Convert values to chart data."""
-        return [
-            {"x": x, "y": float(y)}
-            for x, y in zip(x_values, np.atleast_1d(values).tolist())
-            if not np.isnan(y)
-        ]
-
     # Get values at the point
     values = await _get_point_values(dataset_name, lon, lat)
 
@@ -673,7 +671,7 @@ async def chart_point(
         ref_values = await _get_point_values(dataset_name, ref_lon, ref_lat)
         values = values - ref_values
 
-    dataset_item = values_to_chart_data(values.tolist())
+    dataset_item = _to_chart_data(x_values, values)
 
     return JSONResponse({"datasets": [{"data": dataset_item}], "labels": x_values})
 
@@ -755,11 +753,7 @@ async def multi_point(
                 values = values - ref_values
 
             # Convert to chart data format
-            chart_data = [
-                {"x": x, "y": float(y)}
-                for x, y in zip(x_values, np.atleast_1d(values).tolist())
-                if not np.isnan(y)
-            ]
+            chart_data = _to_chart_data(x_values, values)
 
             # Calculate trend if requested
             trend_data = None
@@ -4,6 +4,7 @@ import contextlib
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -70,6 +71,12 @@ if TYPE_CHECKING:
     Index = ellipsis | slice | int
 
 
+@lru_cache(maxsize=4096)
+def _get_file_dates(filename: str, fmt: str) -> tuple[datetime, ...]:
+    """Parse the dates in `filename`, caching since groups often share files."""
+    return tuple(get_dates(filename, fmt=fmt))
+
+
 @runtime_checkable
 class DatasetReader(Protocol):
     """An array-like interface for reading input datasets.
@@ -225,7 +232,7 @@ class RasterReader(DatasetReader):
     ) -> RasterReader:
         """Create a RasterReader from a GDAL-readable filename."""
         if file_date_fmt:
-            dates = get_dates(filename, fmt=file_date_fmt)
+            dates = _get_file_dates(str(filename), file_date_fmt)
         else:
             dates = None
         try:
@@ -9,7 +9,6 @@ imported everywhere as ``state``.
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 from collections import OrderedDict
@@ -88,6 +87,25 @@ def _open_md(uri: str) -> tuple[xr.Dataset, Transformer, list["PyramidLevel"]]:
     return ds, tr, levels
 
 
+def _read_raster_groups(cfg: Path) -> list:
+    """Load the ``RasterGroup``s from a ``bowser set-data`` config file.
+
+    ``.jsonl`` files hold one group per line; anything else is a JSON array.
+    """
+    from pydantic import TypeAdapter  # noqa: PLC0415
+
+    from .titiler import RasterGroup  # noqa: PLC0415
+
+    adapter = TypeAdapter(list[RasterGroup])
+    if cfg.suffix == ".jsonl":
+        from .utils import load_raster_config  # noqa: PLC0415
+
+        return adapter.validate_python(load_raster_config(cfg))
+    # Parse and validate the whole array in pydantic-core, with no json.loads
+    # dicts in between
+    return adapter.validate_json(cfg.read_bytes())
+
+
 @dataclass
 class PyramidLevel:
     """One level of a multiscale pyramid."""
@@ -155,8 +173,6 @@ class BowserState:
     @classmethod
     def load(cls, settings: Settings) -> "BowserState":
         """Load data sources per the active Settings and return a populated state."""
-        from .titiler import RasterGroup  # noqa: PLC0415
-
         if settings.BOWSER_STACK_DATA_FILE:
             ds, tr, levels = _open_md(settings.BOWSER_STACK_DATA_FILE)
             return cls(mode="md", dataset=ds, transformer_from_lonlat=tr, levels=levels)
@@ -165,8 +181,7 @@ class BowserState:
         if cfg.exists():
             logger.info(f"Loading RasterGroups from {cfg} (COG mode)")
             raster_groups: dict[str, object] = {}
-            for d in json.loads(cfg.read_text()):
-                rg = RasterGroup.model_validate(d)
+            for rg in _read_raster_groups(cfg):
                 raster_groups[rg.name] = rg
             logger.info(
                 f"Found {len(raster_groups)} RasterGroup configs:"
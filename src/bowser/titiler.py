@@ -16,7 +16,12 @@ from starlette import responses
 from titiler.core.algorithm import BaseAlgorithm
 
 from .readers import RasterStackReader
-from .utils import list_bucket
+from .utils import glob_dir, list_bucket
+
+try:  # optional: `bowser-insar[speedups]`
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -321,17 +326,35 @@ class RasterGroup(BaseModel):
         )
 
 
-def _find_files(glob_str: str) -> list[str]:
+def _find_files(
+    glob_str: str, listings: dict[str, list[str]] | None = None
+) -> list[str]:
     if "*" not in glob_str:
         file_list = [glob_str]
     elif glob_str.startswith("s3://"):
         # Need to split the '*' from the rest of the path
         file_list = list_bucket(full_bucket_glob=glob_str)
     else:
-        file_list = sorted(glob(glob_str))
+        file_list = _shallow_glob(glob_str, listings)
+        if file_list is None:
+            file_list = sorted(glob(glob_str))
     return file_list
 
 
+def _shallow_glob(
+    glob_str: str, listings: dict[str, list[str]] | None = None
+) -> list[str] | None:
+    """Match a pattern with wildcards only in its last component using one scandir.
+
+    Returns None if the directory part has wildcards too, so the caller
+    should fall back to `glob`. Otherwise see `utils.glob_dir`.
+    """
+    dirname, pattern = os.path.split(glob_str)
+    if any(c in dirname for c in "*?[") or "**" in pattern:
+        return None
+    return glob_dir(dirname, pattern, listings)
+
+
 # https://github.com/developmentseed/titiler/blob/0fddd7ed268557e82a5e1520cdd7fdf084afa1b8/src/titiler/core/titiler/core/resources/responses.py#L15
 class JSONResponse(responses.JSONResponse):
     """Custom JSON Response."""
@@ -340,8 +363,20 @@ class JSONResponse(responses.JSONResponse):
         """Render JSON.
 
         Same defaults as starlette.responses.JSONResponse.render but allow NaN
-        to be replaced by null using simplejson
+        to be replaced by null using simplejson.
+
+        Uses orjson when installed, which also writes NaN/inf as null and can
+        encode numpy arrays and scalars directly.
         """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    content,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits: let simplejson handle it
+                pass
         return simplejson.dumps(
             content,
             ensure_ascii=False,
@@ -1,7 +1,10 @@
 import json
+import os
 import subprocess
 from datetime import datetime
+from fnmatch import filter as fnmatch_filter
 from functools import cache
+from pathlib import Path
 from typing import Sequence, TypeVar
 
 import numpy as np
@@ -143,6 +146,46 @@ def datetime_to_float(dates: Sequence[DateOrDatetimeT]) -> np.ndarray:
     return date_arr.astype(float) / sec_per_day
 
 
+def load_raster_config(path: str | Path) -> list[dict]:
+    """Read the raster group dicts from a `bowser setup-*` / `set-data` config.
+
+    Files ending in ``.jsonl`` hold one group per line (JSON Lines); anything
+    else is a single JSON array.
+    """
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return json.loads(path.read_text())
+
+
+def glob_dir(
+    dirname: str, pattern: str, listings: dict[str, list[str]] | None = None
+) -> list[str]:
+    """Return the sorted matches of `pattern` in `dirname`, like `glob`.
+
+    Matches exactly like ``sorted(glob(os.path.join(dirname, pattern)))`` for a
+    `pattern` without path separators: hidden files are skipped unless the
+    pattern starts with ".", symlinks are returned unresolved, and a missing
+    directory gives no matches. If `listings` is given, directory listings are
+    read from and stored in it, so several patterns over the same directory
+    only list it once.
+    """
+    names = listings.get(dirname) if listings is not None else None
+    if names is None:
+        try:
+            with os.scandir(dirname or os.curdir) as it:
+                names = [e.name for e in it]
+        except OSError:
+            names = []
+        if listings is not None:
+            listings[dirname] = names
+    if not pattern.startswith("."):
+        names = [n for n in names if not n.startswith(".")]
+    prefix = dirname if not dirname or dirname.endswith("/") else f"{dirname}/"
+    return sorted(prefix + n for n in fnmatch_filter(names, pattern))
+
+
 def list_bucket(
     bucket: str | None = None,
     prefix: str | None = None,
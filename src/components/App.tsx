@@ -20,8 +20,14 @@ function AppContent() {
   useEffect(() => {
     const initializeApp = async () => {
       try {
-        // Fetch config (title), data mode, and datasets
-        const [config, mode] = await Promise.all([fetchConfig(), fetchDataMode()]);
+        // Fetch config (title), data mode, and datasets. None depends on the
+        // others, so issue them together instead of waiting a round-trip for
+        // the mode before asking for the datasets.
+        const [config, mode, datasets] = await Promise.all([
+          fetchConfig(),
+          fetchDataMode(),
+          fetchDatasets(),
+        ]);
 
         if (config.title) {
           setAppTitle(config.title);
@@ -30,7 +36,6 @@ function AppContent() {
 
         dispatch({ type: 'SET_DATA_MODE', payload: mode });
 
-        const datasets = await fetchDatasets();
         dispatch({ type: 'SET_DATASETS', payload: datasets });
 
         const firstDataset = Object.keys(datasets)[0];
@@ -128,6 +128,33 @@ function ScaleBar() {
   return null;
 }
 
+// A tilejson response only depends on its query string, so remember the tile
+// URL for recently used parameter sets. Scrubbing back to a visited date or
+// colormap then swaps the layer without another round-trip.
+const TILE_URL_CACHE_SIZE = 256;
+const tileUrlCache = new Map<string, string>();
+
+// Cached URLs belong to the dataset list they were fetched for. A new list
+// (e.g. after `bowser set-data` and a reload) starts an empty cache, so no
+// tile URL from the old config is served again.
+let tileUrlCacheOwner: object | null = null;
+
+function resetTileUrlCacheFor(datasetInfo: object) {
+  if (tileUrlCacheOwner !== datasetInfo) {
+    tileUrlCache.clear();
+    tileUrlCacheOwner = datasetInfo;
+  }
+}
+
+function cacheTileUrl(endpoint: string, tileUrl: string) {
+  // Re-inserting moves the key to the end, so Map order is least-recently-used first.
+  tileUrlCache.delete(endpoint);
+  tileUrlCache.set(endpoint, tileUrl);
+  if (tileUrlCache.size > TILE_URL_CACHE_SIZE) {
+    tileUrlCache.delete(tileUrlCache.keys().next().value as string);
+  }
+}
+
 function RasterTileLayer() {
   const { state } = useAppContext();
   const [tileUrl, setTileUrl] = useState<string | null>(null);
@@ -144,18 +171,16 @@ function RasterTileLayer() {
     const controller = new AbortController();
     const signal = controller.signal;
 
-    const updateTileLayer = async () => {
-      const currentDatasetInfo = state.datasetInfo[state.currentDataset];
+    resetTileUrlCacheFor(state.datasetInfo);
+    const currentDatasetInfo = state.datasetInfo[state.currentDataset];
+    const maxIdx = currentDatasetInfo.x_values.length - 1;
 
+    const buildEndpoint = (timeIdx: number): string => {
       // Use ONLY state — DO NOT read localStorage here
       const colormap = state.colormap;
       const vmin = state.vmin;
       const vmax = state.vmax;
 
-      // Ensure time index is within bounds
-      const maxIdx = currentDatasetInfo.x_values.length - 1;
-      const timeIdx = Math.max(0, Math.min(state.currentTimeIndex, maxIdx));
-
       // Build parameters
       const params: Record<string, string> = {
         variable: state.currentDataset,
@@ -211,20 +236,51 @@ function RasterTileLayer() {
       if (datasetId) params.dataset = datasetId;
 
       const urlParams = new URLSearchParams(params).toString();
-      const endpoint = state.dataMode === 'md'
+      return state.dataMode === 'md'
         ? `/md/WebMercatorQuad/tilejson.json?${urlParams}`
         : `/cog/WebMercatorQuad/tilejson.json?${urlParams}`;
+    };
+
+    const fetchTileUrl = async (endpoint: string): Promise<string> => {
+      const cached = tileUrlCache.get(endpoint);
+      if (cached !== undefined) {
+        cacheTileUrl(endpoint, cached);
+        return cached;
+      }
+      const response = await fetch(endpoint, { signal });
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      const tileInfo = await response.json();
+      // A request that finished after this effect was torn down may belong to
+      // a dataset list that has since been replaced; don't cache it.
+      if (!signal.aborted) cacheTileUrl(endpoint, tileInfo.tiles[0]);
+      return tileInfo.tiles[0];
+    };
+
+    const updateTileLayer = async () => {
+      // Ensure time index is within bounds
+      const timeIdx = Math.max(0, Math.min(state.currentTimeIndex, maxIdx));
 
       try {
-        const response = await fetch(endpoint, { signal });
-        if (!response.ok) throw new Error(`HTTP ${response.status}`);
-        const tileInfo = await response.json();
+        const url = await fetchTileUrl(buildEndpoint(timeIdx));
         // Only set if not aborted
-        if (!signal.aborted) setTileUrl(tileInfo.tiles[0]);
+        if (!signal.aborted) setTileUrl(url);
       } catch (err) {
         if ((err as any).name !== 'AbortError') {
           console.error('Error fetching tile info:', err);
         }
+        return;
+      }
+
+      // Warm the cache for the neighbouring dates, the most likely next steps.
+      // One at a time, after the visible layer, so they never compete with it;
+      // they share the abort signal, so moving on cancels any still pending.
+      for (const idx of [timeIdx + 1, timeIdx - 1]) {
+        if (idx < 0 || idx > maxIdx || signal.aborted) continue;
+        try {
+          await fetchTileUrl(buildEndpoint(idx));
+        } catch {
+          // Best effort: a failed prefetch is retried on demand.
+        }
       }
     };
 
@@ -250,8 +306,10 @@ function RasterTileLayer() {
   if (!tileUrl) return null;
 
   return (
+    // Keep one layer mounted: react-leaflet calls setUrl() when `url` changes,
+    // which swaps tiles in place instead of tearing the layer down and
+    // re-adding it on every time step.
     <TileLayer
-      key={tileUrl}  // force refresh if URL changes
       url={tileUrl}
       opacity={state.opacity}
       maxZoom={22}
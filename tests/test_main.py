@@ -1,6 +1,7 @@
 import os
 import signal
 import subprocess
+import sys
 import time
 from pathlib import Path
 
@@ -84,3 +85,60 @@ def test_bowser_cli_run_command(tmp_path):
 
     # Check it didn't crash immediately (returncode from kill is -9, not 1)
     assert proc.returncode != 1, "Server crashed on startup"
+
+
+def test_cli_help_skips_heavy_imports():
+    """Test that `bowser --help` dispatches without loading titiler/rasterio."""
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from bowser.cli import cli_app\n"
+        "assert CliRunner().invoke(cli_app, ['--help']).exit_code == 0\n"
+        "heavy = {'bowser.titiler', 'rasterio', 'numpy', 'osgeo'}\n"
+        "print(sorted(heavy & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_setup_aligned_disp_s1_jsonl(tmp_path):
+    """Test that a `.jsonl` output holds one RasterGroup per line and loads back."""
+    from bowser.state import _read_raster_groups
+    from bowser.utils import load_raster_config
+
+    json_file = tmp_path / "bowser_rasters.json"
+    jsonl_file = tmp_path / "bowser_rasters.jsonl"
+    for out in (json_file, jsonl_file):
+        subprocess.run(
+            ["bowser", "setup-aligned-disp-s1", str(DATA_DIR), "-o", out],
+            check=True,
+            cwd=Path(__file__).parent.parent,
+        )
+
+    assert load_raster_config(jsonl_file) == load_raster_config(json_file)
+    groups = _read_raster_groups(jsonl_file)
+    assert len(groups) == len(jsonl_file.read_text().splitlines())
+    expected = _read_raster_groups(json_file)
+    assert [g.model_dump() for g in groups] == [g.model_dump() for g in expected]
+
+
+def test_prepare_outputs_skip_hidden_files(tmp_path):
+    """Test that DISP-S1 and NISAR listings skip dotfiles, like `glob`."""
+    from bowser._prepare_disp_s1 import get_disp_s1_outputs
+    from bowser._prepare_nisar import get_nisar_outputs
+
+    for subdir in ("displacement", "unwrappedPhase"):
+        (tmp_path / subdir).mkdir()
+        (tmp_path / subdir / "20160708_20160801.vrt").touch()
+        (tmp_path / subdir / ".x.vrt").touch()
+
+    disp = {g["name"]: g["file_list"] for g in get_disp_s1_outputs(tmp_path)}
+    assert disp["Displacement"] == [
+        str((tmp_path / "displacement/20160708_20160801.vrt").resolve())
+    ]
+    nisar = {g["name"]: g["file_list"] for g in get_nisar_outputs(tmp_path)}
+    assert nisar["Unwrapped Phase"] == [
+        str(tmp_path / "unwrappedPhase/20160708_20160801.vrt")
+    ]
@@ -1,4 +1,4 @@
-"""Tests for bowser.titiler date formatting and reference date detection."""
+"""Tests for bowser.titiler date formatting, reference dates and file globbing."""
 
 from datetime import datetime
 
@@ -144,3 +144,61 @@ class TestDuplicateSecondaryDates:
         ):
             x = rg.x_values
             assert x == ["2016-02-01", "2016-02-15", "2016-03-01"]
+
+
+class TestShallowGlob:
+    """`_shallow_glob`/`_find_files` should match exactly what `glob` finds."""
+
+    @pytest.fixture()
+    def data_dir(self, tmp_path):
+        for name in [
+            "b_20160801.tif",
+            "a_20160708.tif",
+            "a_20160708.tif.aux.xml",
+            "c_2016.vrt",
+            ".hidden.tif",
+            ".hidden.vrt",
+        ]:
+            (tmp_path / name).touch()
+        (tmp_path / "sub.tif").mkdir()
+        return tmp_path
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*.tif",
+            "*",
+            ".*",
+            ".hidden*",
+            "?_2016*.tif",
+            "[ab]_*.tif",
+            "[!a]*",
+            "*[0-9].vrt",
+            "missing_dir/*.tif",
+        ],
+    )
+    def test_matches_glob(self, data_dir, pattern):
+        from glob import glob
+
+        from bowser.titiler import _find_files, _shallow_glob
+
+        glob_str = str(data_dir / pattern)
+        expected = sorted(glob(glob_str))
+        assert _shallow_glob(glob_str) == expected
+        assert _find_files(glob_str) == expected
+
+    def test_shared_listings(self, data_dir):
+        from glob import glob
+
+        from bowser.titiler import _shallow_glob
+
+        listings: dict[str, list[str]] = {}
+        for pattern in ["*.tif", "*.vrt", ".*"]:
+            glob_str = str(data_dir / pattern)
+            assert _shallow_glob(glob_str, listings) == sorted(glob(glob_str))
+        assert list(listings) == [str(data_dir)]
+
+    def test_wildcard_directory_falls_back(self, data_dir):
+        from bowser.titiler import _shallow_glob
+
+        assert _shallow_glob(str(data_dir / "*" / "*.tif")) is None